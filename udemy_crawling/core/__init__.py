@@ -1,10 +1,12 @@
 from .config import ServerConfig, set_log_level
 from .logger import logger
-from .models import UdemyLecture, TitleSet
+from .models import UdemyLecture, TitleSet, MessageState, MessageStatus
 
 __all__ = [
     "UdemyLecture",
     "TitleSet",
+    "MessageState",
+    "MessageStatus",
     "ServerConfig",
     "set_log_level",
     "logger",
@@ -1,7 +1,9 @@
 import re
 import textwrap
+from enum import Enum
 from functools import cached_property
 from typing import Optional, NamedTuple
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
@@ -18,6 +20,7 @@ class UdemyLecture(BaseModel):
     raw_lecture: str = Field(..., description="Lecture")
     transcripts: list[str] = Field(..., description="Lecture transcript list")
     messageId: Optional[str] = Field(None, description="Message ID for tracking")
+    course: Optional[str] = Field(None, description="Course the lecture belongs to")
 
     @cached_property
     def section(self) -> TitleSet:
@@ -42,3 +45,24 @@ class UdemyLecture(BaseModel):
     def chunks(self) -> list[str]:
         total_scripts = "\n".join(self.transcripts)
         return textwrap.wrap(total_scripts, width=2000)
+
+
+class MessageState(str, Enum):
+    QUEUED = "queued"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class MessageStatus(BaseModel):
+    """Tracks the processing state of a queued message by its message ID."""
+
+    message_id: str
+    state: MessageState = MessageState.QUEUED
+    course: Optional[str] = None
+    page_id: Optional[UUID] = None
+    error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.state in (MessageState.COMPLETED, MessageState.FAILED)
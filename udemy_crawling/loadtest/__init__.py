@@ -0,0 +1,10 @@
+from .runner import LoadTestConfig, LoadTestReport, format_report, run_load_test
+from .stub import StubNotionBackend
+
+__all__ = [
+    "LoadTestConfig",
+    "LoadTestReport",
+    "StubNotionBackend",
+    "format_report",
+    "run_load_test",
+]
@@ -0,0 +1,75 @@
+import argparse
+import asyncio
+import json
+import logging
+import math
+from dataclasses import asdict
+from typing import Any
+
+from udemy_crawling import set_log_level
+from udemy_crawling.loadtest import LoadTestConfig, format_report, run_load_test
+
+
+def _float_list(value: str) -> tuple[float, ...]:
+    return tuple(float(item) for item in value.split(","))
+
+
+def _int_list(value: str) -> tuple[int, ...]:
+    return tuple(int(item) for item in value.split(","))
+
+
+def _replace_lost(value: Any) -> Any:
+    """Replace the `inf` latencies of unpersisted lectures with `None`."""
+    if isinstance(value, dict):
+        return {key: _replace_lost(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_replace_lost(item) for item in value]
+    if isinstance(value, float) and math.isinf(value):
+        return None
+    return value
+
+
+def parse_config() -> tuple[LoadTestConfig, str]:
+    parser = argparse.ArgumentParser(
+        description="Runs a WebSocket load test against a stubbed Notion backend."
+    )
+
+    parser.add_argument("--clients", type=int, default=10)
+    parser.add_argument("--rates", type=_float_list, default=(10, 20, 40, 80, 160))
+    parser.add_argument("--step-duration", type=float, default=60.0)
+    parser.add_argument("--lecture-sizes", type=_int_list, default=(20_000,))
+    parser.add_argument("--duplicate-ratio", type=float, default=0.0)
+    parser.add_argument("--notion-latency", type=float, default=0.3)
+    parser.add_argument("--notion-jitter", type=float, default=0.1)
+    parser.add_argument("--latency-slo", type=float, default=30.0)
+    parser.add_argument("--drain-timeout", type=float, default=120.0)
+    parser.add_argument("--sample-interval", type=float, default=1.0)
+    parser.add_argument("--json", type=str, default=None)
+
+    args = parser.parse_args()
+
+    config = LoadTestConfig(
+        clients=args.clients,
+        rates_per_minute=args.rates,
+        step_duration=args.step_duration,
+        lecture_sizes=args.lecture_sizes,
+        duplicate_ratio=args.duplicate_ratio,
+        notion_latency=args.notion_latency,
+        notion_jitter=args.notion_jitter,
+        latency_slo=args.latency_slo,
+        drain_timeout=args.drain_timeout,
+        sample_interval=args.sample_interval,
+    )
+    return config, args.json
+
+
+if __name__ == "__main__":
+    set_log_level(logging.INFO)
+
+    config, json_path = parse_config()
+    report = asyncio.run(run_load_test(config))
+    print(format_report(report))
+
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump(_replace_lost(asdict(report)), f, indent=2, allow_nan=False)
@@ -0,0 +1,447 @@
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import queue
+import random
+import socket
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+from uuid import uuid4
+
+from udemy_crawling.core.logger import logger
+
+if TYPE_CHECKING:
+    from websockets import ClientConnection
+
+
+@dataclass(frozen=True)
+class LoadTestConfig:
+    clients: int = 10
+    rates_per_minute: tuple[float, ...] = (10, 20, 40, 80, 160)
+    step_duration: float = 60.0
+    lecture_sizes: tuple[int, ...] = (20_000,)
+    duplicate_ratio: float = 0.0
+    lectures_per_section: int = 10
+    notion_latency: float = 0.3
+    notion_jitter: float = 0.1
+    latency_slo: float = 30.0
+    drain_timeout: float = 120.0
+    sample_interval: float = 1.0
+
+
+@dataclass
+class StepResult:
+    rate_per_minute: float
+    sent: int = 0
+    duplicates: int = 0
+    unique: int = 0
+    accepted: int = 0
+    errors: int = 0
+    persisted: int = 0
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    p99: Optional[float] = None
+    max: Optional[float] = None
+    saturated: bool = False
+
+
+@dataclass(frozen=True)
+class ResourceSample:
+    elapsed: float
+    rss_mb: float
+    cpu_percent: float
+
+
+@dataclass
+class LoadTestReport:
+    config: LoadTestConfig
+    steps: list[StepResult] = field(default_factory=list)
+    samples: list[ResourceSample] = field(default_factory=list)
+    saturation_rate: Optional[float] = None
+    max_sustainable_rate: Optional[float] = None
+
+
+@dataclass
+class _Lecture:
+    number: int
+    step: int
+    payload: str
+    accepted_at: Optional[float] = None
+    persisted_at: Optional[float] = None
+    failed_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.persisted_at is not None or self.failed_at is not None
+
+    @property
+    def latency(self) -> Optional[float]:
+        if self.accepted_at is None or self.persisted_at is None:
+            return None
+        return max(self.persisted_at - self.accepted_at, 0.0)
+
+
+def _serve(port: int, latency: float, jitter: float, events: "queue.Queue") -> None:
+    """Child process entry point: the real server backed by the Notion stub."""
+    from udemy_crawling.core import ServerConfig
+    from udemy_crawling.loadtest.stub import StubNotionBackend
+    from udemy_crawling.websocket_server import start_websocket_server
+
+    backend = StubNotionBackend(
+        latency=latency,
+        jitter=jitter,
+        on_persisted=lambda number, at: events.put((number, at)),
+    )
+    config = ServerConfig(notion_token="stub", database_id=uuid4(), websocket_port=port)
+    asyncio.run(start_websocket_server(config, notion_client=backend.client()))
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+def _percentile(values: list[float], percent: float) -> Optional[float]:
+    """Nearest-rank percentile, `inf` entries stand for unpersisted lectures."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+class _ResourceSampler:
+    """Samples RSS and CPU usage of a process from `/proc` (Linux only)."""
+
+    def __init__(self, pid: int):
+        self.stat_path = f"/proc/{pid}/stat"
+        self.statm_path = f"/proc/{pid}/statm"
+        self.available = os.path.exists(self.stat_path)
+        self.page_size = os.sysconf("SC_PAGE_SIZE") if self.available else 0
+        self.ticks = os.sysconf("SC_CLK_TCK") if self.available else 0
+        self.started_at = time.monotonic()
+        self.last: Optional[tuple[float, float]] = None
+
+    def _cpu_seconds(self) -> float:
+        with open(self.stat_path) as f:
+            # Skip past the command name, which may itself contain spaces
+            fields = f.read().rsplit(")", 1)[1].split()
+        utime, stime = int(fields[11]), int(fields[12])
+        return (utime + stime) / self.ticks
+
+    def _rss_mb(self) -> float:
+        with open(self.statm_path) as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * self.page_size / (1024 * 1024)
+
+    def sample(self) -> Optional[ResourceSample]:
+        if not self.available:
+            return None
+        try:
+            now, cpu = time.monotonic(), self._cpu_seconds()
+            rss = self._rss_mb()
+        except (OSError, IndexError, ValueError):
+            return None
+
+        cpu_percent = 0.0
+        if self.last:
+            last_now, last_cpu = self.last
+            cpu_percent = (cpu - last_cpu) / max(now - last_now, 1e-9) * 100
+        self.last = (now, cpu)
+
+        return ResourceSample(
+            elapsed=round(now - self.started_at, 2),
+            rss_mb=round(rss, 2),
+            cpu_percent=round(cpu_percent, 1),
+        )
+
+
+class _LoadGenerator:
+    def __init__(self, config: LoadTestConfig, port: int, events: "queue.Queue"):
+        self.config = config
+        self.url = f"ws://localhost:{port}"
+        self.events = events
+        self.connections: list["ClientConnection"] = []
+        self.lectures: dict[int, _Lecture] = {}
+        self.by_message_id: dict[str, _Lecture] = {}
+        self.steps: list[StepResult] = []
+        self.transcripts = {
+            size: self._build_transcripts(size) for size in config.lecture_sizes
+        }
+
+    @staticmethod
+    def _build_transcripts(size: int) -> list[str]:
+        text = ("lorem ipsum dolor sit amet " * (size // 27 + 1))[:size]
+        return [text[i : i + 80] for i in range(0, len(text), 80)]
+
+    async def connect(self) -> None:
+        from websockets import connect
+
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                first = await connect(self.url)
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                await asyncio.sleep(0.1)
+
+        self.connections = [first] + [
+            await connect(self.url) for _ in range(self.config.clients - 1)
+        ]
+        logger.info(f"✅ Opened {len(self.connections)} load test clients")
+
+    async def receive(self, websocket: "ClientConnection") -> None:
+        from websockets.exceptions import ConnectionClosed
+
+        try:
+            async for message in websocket:
+                response = json.loads(message)
+                lecture = self.by_message_id.get(response.get("messageId"))
+                if lecture is None:
+                    continue
+
+                if response.get("status") == "error":
+                    self.steps[lecture.step].errors += 1
+                elif response.get("event") == "failed":
+                    # Resent lectures that fail again are only counted once
+                    if lecture.failed_at is None:
+                        lecture.failed_at = time.time()
+                        self.steps[lecture.step].errors += 1
+                elif (
+                    response.get("status") == "success" and lecture.accepted_at is None
+                ):
+                    lecture.accepted_at = time.time()
+                    self.steps[lecture.step].accepted += 1
+        except ConnectionClosed:
+            pass
+
+    def drain_events(self) -> None:
+        while True:
+            try:
+                number, persisted_at = self.events.get_nowait()
+            except queue.Empty:
+                return
+            lecture = self.lectures.get(number)
+            if lecture and lecture.persisted_at is None:
+                lecture.persisted_at = persisted_at
+
+    def _next_lecture(self, step: int) -> tuple[_Lecture, bool]:
+        if self.lectures and random.random() < self.config.duplicate_ratio:
+            return random.choice(list(self.lectures.values())), True
+
+        number = len(self.lectures) + 1
+        message_id = str(uuid4())
+        payload = json.dumps(
+            {
+                "action": "save_transcript",
+                "messageId": message_id,
+                "raw_section": (
+                    f"Section {(number - 1) // self.config.lectures_per_section + 1}"
+                    f": Load Test"
+                ),
+                "raw_lecture": f"{number}. Load test lecture {number}",
+                "transcripts": self.transcripts[
+                    random.choice(self.config.lecture_sizes)
+                ],
+            }
+        )
+        lecture = _Lecture(number=number, step=step, payload=payload)
+        self.lectures[number] = lecture
+        self.by_message_id[message_id] = lecture
+        return lecture, False
+
+    async def run_step(self, rate_per_minute: float) -> StepResult:
+        step = len(self.steps)
+        result = StepResult(rate_per_minute=rate_per_minute)
+        self.steps.append(result)
+
+        deadline = time.monotonic() + self.config.step_duration
+        while True:
+            # Poisson arrivals at the requested lectures-per-minute rate
+            await asyncio.sleep(random.expovariate(rate_per_minute / 60))
+            if time.monotonic() >= deadline:
+                break
+
+            lecture, duplicate = self._next_lecture(step)
+            result.sent += 1
+            result.duplicates += duplicate
+            result.unique += not duplicate
+            await random.choice(self.connections).send(lecture.payload)
+
+        self.drain_events()
+        self.evaluate(step, now=time.time())
+        return result
+
+    def evaluate(self, step: int, now: Optional[float] = None) -> None:
+        """
+        Compute latency percentiles of a step. Lectures accepted more than
+        `latency_slo` seconds before `now` but not yet persisted count as
+        infinitely late; younger ones are still in flight and are ignored.
+        When `now` is omitted every unpersisted lecture counts as late.
+        Failed lectures are already counted as errors and are left out.
+        """
+        result = self.steps[step]
+        latencies: list[float] = []
+        for lecture in self.lectures.values():
+            if lecture.step != step or lecture.accepted_at is None:
+                continue
+            if lecture.latency is not None:
+                latencies.append(lecture.latency)
+            elif lecture.failed_at is not None:
+                continue
+            elif now is None or now - lecture.accepted_at > self.config.latency_slo:
+                latencies.append(math.inf)
+
+        result.persisted = sum(
+            1
+            for lecture in self.lectures.values()
+            if lecture.step == step and lecture.persisted_at is not None
+        )
+        result.p50 = _percentile(latencies, 50)
+        result.p95 = _percentile(latencies, 95)
+        result.p99 = _percentile(latencies, 99)
+        result.max = max(latencies) if latencies else None
+        result.saturated = bool(result.errors) or (
+            result.p95 is not None and result.p95 > self.config.latency_slo
+        )
+
+    async def drain(self) -> None:
+        deadline = time.monotonic() + self.config.drain_timeout
+        while time.monotonic() < deadline:
+            self.drain_events()
+            if all(
+                lecture.finished
+                for lecture in self.lectures.values()
+                if lecture.accepted_at is not None
+            ):
+                break
+            await asyncio.sleep(0.5)
+
+        self.drain_events()
+        for step in range(len(self.steps)):
+            self.evaluate(step)
+
+    async def close(self) -> None:
+        for websocket in self.connections:
+            await websocket.close()
+
+
+async def _sample_resources(
+    sampler: _ResourceSampler, report: LoadTestReport, interval: float
+) -> None:
+    while True:
+        if sample := sampler.sample():
+            report.samples.append(sample)
+        await asyncio.sleep(interval)
+
+
+async def run_load_test(config: LoadTestConfig) -> LoadTestReport:
+    """
+    Ramp `save_transcript` traffic through the configured arrival rates
+    against a server running in a child process with a stubbed Notion
+    backend. The ramp stops at the first step whose p95 accepted-to-persisted
+    latency exceeds `latency_slo`, or that had error replies or lectures the
+    worker reported as failed.
+    """
+    context = multiprocessing.get_context("spawn")
+    events = context.Queue()
+    port = _free_port()
+    server = context.Process(
+        target=_serve,
+        args=(port, config.notion_latency, config.notion_jitter, events),
+        daemon=True,
+    )
+    server.start()
+    logger.info(f"🚀 Load test server started (pid {server.pid}, port {port})")
+
+    report = LoadTestReport(config=config)
+    sampler = _ResourceSampler(server.pid)
+    if not sampler.available:
+        logger.warning("⚠️ /proc is not available, skipping RSS/CPU sampling")
+    sampler_task = asyncio.create_task(
+        _sample_resources(sampler, report, config.sample_interval)
+    )
+
+    generator = _LoadGenerator(config, port, events)
+    try:
+        await generator.connect()
+        receivers = [
+            asyncio.create_task(generator.receive(websocket))
+            for websocket in generator.connections
+        ]
+
+        for rate in config.rates_per_minute:
+            logger.info(f"🟡 Running step at {rate} lectures/min")
+            result = await generator.run_step(rate)
+            if result.saturated:
+                logger.info(f"⚠️ Saturated at {rate} lectures/min")
+                break
+
+        await generator.drain()
+        await generator.close()
+        await asyncio.gather(*receivers)
+    finally:
+        sampler_task.cancel()
+        server.terminate()
+        server.join()
+
+    report.steps = generator.steps
+    for result in report.steps:
+        if result.saturated:
+            report.saturation_rate = result.rate_per_minute
+            break
+        report.max_sustainable_rate = result.rate_per_minute
+
+    return report
+
+
+def _format_seconds(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    if math.isinf(value):
+        return "lost"
+    return f"{value:.2f}s"
+
+
+def format_report(report: LoadTestReport) -> str:
+    config = report.config
+    lines = [
+        f"Clients: {config.clients}, lecture sizes: {list(config.lecture_sizes)}, "
+        f"duplicate ratio: {config.duplicate_ratio}, "
+        f"Notion latency: {config.notion_latency}s, SLO (p95): {config.latency_slo}s",
+        "",
+        f"{'rate/min':>9} {'sent':>6} {'dup':>5} {'accepted':>9} {'persisted':>10} "
+        f"{'errors':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}",
+    ]
+    for result in report.steps:
+        lines.append(
+            f"{result.rate_per_minute:>9g} {result.sent:>6} {result.duplicates:>5} "
+            f"{result.accepted:>9} {result.persisted:>10} {result.errors:>7} "
+            f"{_format_seconds(result.p50):>8} {_format_seconds(result.p95):>8} "
+            f"{_format_seconds(result.p99):>8} {_format_seconds(result.max):>8}"
+            + ("  <- saturated" if result.saturated else "")
+        )
+
+    lines.append("")
+    if report.samples:
+        lines.append(
+            f"Server RSS: {min(s.rss_mb for s in report.samples):.1f}"
+            f"-{max(s.rss_mb for s in report.samples):.1f} MB, "
+            f"peak CPU: {max(s.cpu_percent for s in report.samples):.1f}%"
+        )
+    if report.saturation_rate is not None:
+        lines.append(f"Saturation point: {report.saturation_rate:g} lectures/min")
+    else:
+        lines.append("Saturation point: not reached")
+    if report.max_sustainable_rate is not None:
+        lines.append(
+            f"Max sustainable rate: {report.max_sustainable_rate:g} lectures/min"
+        )
+
+    return "\n".join(lines)
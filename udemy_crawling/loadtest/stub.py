@@ -0,0 +1,150 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Optional
+from uuid import UUID, uuid4
+
+from udemy_crawling.notion.models import (
+    LecturePage,
+    LecturePagePropertySet,
+    LecturePagePropertyType,
+    NotionClient,
+    PageTypeTag,
+)
+
+if TYPE_CHECKING:
+    from pynotion.models import TxPage, TxPagination, PropertyFilter, PropertySort
+
+
+@dataclass
+class _StubPage:
+    """Minimal stand-in for a pynotion RxPage, readable by the converter."""
+
+    id: UUID
+    properties: dict[str, Any]
+    icon: None = None
+
+    def model_dump(self, mode: str = "python") -> dict:
+        return {"id": str(self.id) if mode == "json" else self.id}
+
+
+@dataclass
+class _StubRow:
+    page: _StubPage
+    tag: str
+    number: Optional[int]
+
+
+def _to_rx_property(value: Any) -> Optional[SimpleNamespace]:
+    """Convert a Tx property value into the `type`-keyed shape of a Rx value."""
+    if getattr(value, "multi_select", None) is not None:
+        return SimpleNamespace(
+            type="multi_select",
+            multi_select=[SimpleNamespace(name=o.name) for o in value.multi_select],
+        )
+    if getattr(value, "relation", None) is not None:
+        return SimpleNamespace(
+            type="relation",
+            relation=[SimpleNamespace(id=r.id) for r in value.relation],
+        )
+    if hasattr(value, "number"):
+        return SimpleNamespace(type="number", number=value.number)
+    if hasattr(value, "select"):
+        return SimpleNamespace(type="select", select=value.select)
+    return None
+
+
+def _collect_conditions(property_filter: Any) -> tuple[Optional[str], Optional[int]]:
+    """Extract the (tag, number) pair used by the queries in `database.py`."""
+    tag, number = None, None
+    filters = getattr(property_filter, "filters", None) or [property_filter]
+    for _filter in filters:
+        if getattr(_filter, "multi_select", None) is not None:
+            tag = _filter.multi_select.contains
+        elif getattr(_filter, "number", None) is not None:
+            number = _filter.number.equals
+    return tag, number
+
+
+@dataclass
+class _StubDatabasesEndpoint:
+    backend: "StubNotionBackend"
+
+    async def query_databases(
+        self,
+        database_id: UUID,
+        property_filter: Optional["PropertyFilter"] = None,
+        sort: Optional[list["PropertySort"]] = None,
+        pagination: Optional["TxPagination"] = None,
+    ) -> SimpleNamespace:
+        await self.backend.simulate_latency()
+        tag, number = _collect_conditions(property_filter)
+
+        rows = [
+            row
+            for row in self.backend.rows
+            if (tag is None or row.tag == tag)
+            and (number is None or row.number == number)
+        ]
+        if sort:
+            rows.sort(key=lambda row: row.number or 0, reverse=True)
+        if pagination and pagination.page_size:
+            rows = rows[: pagination.page_size]
+
+        return SimpleNamespace(results=[row.page for row in rows])
+
+
+@dataclass
+class _StubPagesEndpoint:
+    backend: "StubNotionBackend"
+
+    async def create_page(self, tx_page: "TxPage") -> _StubPage:
+        await self.backend.simulate_latency()
+
+        properties = {
+            key: rx_value
+            for key, value in tx_page.properties.items()
+            if (rx_value := _to_rx_property(value)) is not None
+        }
+        page = _StubPage(id=uuid4(), properties=properties)
+
+        tags = properties.get(LecturePagePropertyType.TAG)
+        tag = tags.multi_select[0].name if tags else None
+        number_value = properties.get(LecturePagePropertyType.NUMBER)
+        number = number_value.number if number_value else None
+
+        self.backend.rows.append(_StubRow(page, tag, number))
+        if tag == PageTypeTag.LECTURE.value and self.backend.on_persisted:
+            self.backend.on_persisted(number, time.time())
+
+        return page
+
+
+@dataclass
+class StubNotionBackend:
+    """
+    In-memory replacement for the Notion API used by the load test.
+
+    Every request sleeps for `latency` (+/- `jitter`) seconds to mimic the
+    round trip to Notion, and `on_persisted` is called with the lecture
+    number and a wall clock timestamp whenever a lecture page is created.
+    """
+
+    latency: float = 0.3
+    jitter: float = 0.1
+    on_persisted: Optional[Callable[[Optional[int], float], None]] = None
+    rows: list[_StubRow] = field(default_factory=list)
+
+    async def simulate_latency(self) -> None:
+        delay = self.latency + random.uniform(-self.jitter, self.jitter)
+        await asyncio.sleep(max(delay, 0.0))
+
+    def client(self, dataset_id: Optional[UUID] = None) -> NotionClient:
+        endpoint_registry = SimpleNamespace(
+            databases=_StubDatabasesEndpoint(self),
+            pages=_StubPagesEndpoint(self),
+        )
+        template_page = LecturePage(id=uuid4(), properties=LecturePagePropertySet())
+        return NotionClient(endpoint_registry, dataset_id or uuid4(), template_page)
@@ -143,14 +143,17 @@ async def _create_section_page(
     return rx_page_to_lecture_page(section_page)
 
 
-async def create_lecture_page(client: "NotionClient", udemy_lecture: "UdemyLecture"):
+async def create_lecture_page(
+    client: "NotionClient", udemy_lecture: "UdemyLecture"
+) -> "UUID":
+    """Creates the lecture page (and its section) and returns the page ID."""
     found_lecture = await search_lecture_by_number(
         client.endpoint_registry, client.dataset_id, udemy_lecture.lecture.number
     )
 
     if found_lecture:
         logger.debug(f"Found lecture page for {found_lecture.model_dump(mode='json')}")
-        return
+        return found_lecture.id
 
     section_page: LecturePage = await _create_section_page(
         client, udemy_lecture.section
@@ -170,3 +173,5 @@ async def create_lecture_page(client: "NotionClient", udemy_lecture: "UdemyLectu
     )
 
     logger.debug(f"Created lecture page: {created_page.model_dump(mode='json')}")
+
+    return created_page.id
@@ -1,34 +1,88 @@
 import asyncio
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
 
-from udemy_crawling.core import logger, UdemyLecture
+from udemy_crawling.core import logger, UdemyLecture, MessageState, MessageStatus
 from udemy_crawling.notion.creator import create_lecture_page
 
 if TYPE_CHECKING:
     from udemy_crawling.notion.models import NotionClient
 
+MAX_TRACKED_MESSAGES = 1000
+
 message_queue = asyncio.Queue()
+message_statuses: "OrderedDict[str, MessageStatus]" = OrderedDict()
+
+
+def get_message_status(message_id: str) -> Optional[MessageStatus]:
+    return message_statuses.get(message_id)
 
 
-async def queue_worker(client: "NotionClient"):
+def _forget_finished_messages():
+    """Drops the oldest finished statuses once the tracking limit is exceeded."""
+    finished_ids = [
+        message_id for message_id, status in message_statuses.items() if status.finished
+    ]
+    excess = max(len(message_statuses) - MAX_TRACKED_MESSAGES, 0)
+    for message_id in finished_ids[:excess]:
+        del message_statuses[message_id]
+
+
+async def queue_worker(
+    client: "NotionClient",
+    on_finished: Optional[Callable[[MessageStatus], Awaitable[None]]] = None,
+):
     while True:
         message_data = await message_queue.get()
         logger.info(f"🟢 Processing message: {message_data}")
 
+        status = None
+        if message_data and (message_id := message_data.get("messageId")):
+            status = message_statuses.setdefault(
+                message_id, MessageStatus(message_id=message_id)
+            )
+            status.state = MessageState.PROCESSING
+
         if message_data:
             try:
                 udemy_lecture = UdemyLecture(**message_data)
                 logger.info(f"✅ Parsed udemy lecture: {udemy_lecture}")
 
-                await create_lecture_page(client, udemy_lecture)
+                page_id = await create_lecture_page(client, udemy_lecture)
                 logger.info(f"📩 Successfully created page for {udemy_lecture}")
 
+                if status:
+                    status.state = MessageState.COMPLETED
+                    status.page_id = page_id
+
             except Exception as e:
                 logger.error(f"⚠️ Error processing message: {e}")
 
+                if status:
+                    status.state = MessageState.FAILED
+                    status.error = str(e)
+
+        if status:
+            message_statuses.move_to_end(status.message_id)
+            _forget_finished_messages()
+
+            if on_finished:
+                try:
+                    await on_finished(status)
+                except Exception as e:
+                    logger.error(f"⚠️ Error notifying clients: {e}")
+
         message_queue.task_done()
 
 
-async def add_to_queue(message: dict):
+async def add_to_queue(message: dict) -> Optional[MessageStatus]:
     logger.info(f"🟡 Adding to queue: {message}")
+
+    status = None
+    if message_id := message.get("messageId"):
+        status = MessageStatus(message_id=message_id, course=message.get("course"))
+        message_statuses[message_id] = status
+        message_statuses.move_to_end(message_id)
+
     await message_queue.put(message)
+    return status
@@ -1,17 +1,136 @@
 import asyncio
 import json
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
+from websockets.asyncio.server import broadcast
 from websockets.exceptions import ConnectionClosed
 
+from udemy_crawling.core import MessageState
 from udemy_crawling.core.logger import logger
-from udemy_crawling.queue_handler import add_to_queue, queue_worker
+from udemy_crawling.queue_handler import (
+    add_to_queue,
+    get_message_status,
+    queue_worker,
+)
 
 if TYPE_CHECKING:
     from udemy_crawling.core.config import ServerConfig
     from websockets import ServerConnection
+    from udemy_crawling.core import MessageStatus
+    from udemy_crawling.notion.models import NotionClient
+
+SUPPORTED_ACTIONS = ("save_transcript", "status", "subscribe", "unsubscribe")
 
 connected_clients = set()
+# messageId -> connections that sent (or resent) the message
+message_origins: dict[str, set["ServerConnection"]] = {}
+# course -> connections subscribed to its completion events
+course_subscribers: dict[str, set["ServerConnection"]] = {}
+
+
+def _build_status_payload(status: "MessageStatus") -> dict:
+    return {
+        "messageId": status.message_id,
+        "course": status.course,
+        "pageId": str(status.page_id) if status.page_id else None,
+        "error": status.error,
+    }
+
+
+def _build_event(status: "MessageStatus") -> str:
+    return json.dumps({"event": status.state.value, **_build_status_payload(status)})
+
+
+async def notify_clients(status: "MessageStatus"):
+    """Pushes a completed/failed event to the origins and the course subscribers."""
+    recipients = set(course_subscribers.get(status.course, ()))
+    recipients |= message_origins.pop(status.message_id, set())
+
+    recipients &= connected_clients
+    if recipients:
+        logger.info(f"📣 Notifying {len(recipients)} client(s): {status}")
+        broadcast(recipients, _build_event(status))
+
+
+async def _handle_save_transcript(websocket: "ServerConnection", data: dict) -> dict:
+    message_id = data.get("messageId")
+    status = get_message_status(message_id) if message_id else None
+
+    # Resent messages that are still pending or already saved are not re-queued
+    if status and status.state != MessageState.FAILED:
+        if not status.finished:
+            message_origins.setdefault(message_id, set()).add(websocket)
+        return {
+            "status": "success",
+            "message": f"Data already {status.state.value}",
+            "state": status.state.value,
+            **_build_status_payload(status),
+        }
+
+    if message_id:
+        message_origins.setdefault(message_id, set()).add(websocket)
+    await add_to_queue(data)
+    return {
+        "status": "success",
+        "message": "Data received and queued",
+        "messageId": message_id,
+    }
+
+
+def _handle_status(data: dict) -> dict:
+    message_id = data.get("messageId")
+    status = get_message_status(message_id) if message_id else None
+
+    if status is None:
+        return {
+            "status": "error",
+            "message": "Unknown messageId",
+            "messageId": message_id,
+        }
+    return {
+        "status": "success",
+        "state": status.state.value,
+        **_build_status_payload(status),
+    }
+
+
+def _handle_subscription(websocket: "ServerConnection", data: dict) -> dict:
+    action, course = data.get("action"), data.get("course")
+
+    if not course:
+        return {"status": "error", "message": "Missing course"}
+
+    if action == "subscribe":
+        course_subscribers.setdefault(course, set()).add(websocket)
+    elif action == "unsubscribe":
+        subscribers = course_subscribers.get(course, set())
+        subscribers.discard(websocket)
+        if not subscribers:
+            course_subscribers.pop(course, None)
+    else:
+        return {"status": "error", "message": f"Unsupported action: {action}"}
+    return {"status": "success", "message": f"{action.capitalize()}d", "course": course}
+
+
+def _validate_identifiers(data: dict) -> Optional[dict]:
+    """Rejects a `messageId` or `course` that is present but not a string."""
+    for key in ("messageId", "course"):
+        value = data.get(key)
+        if value is not None and not isinstance(value, str):
+            return {"status": "error", "message": f"Invalid {key}: expected a string"}
+    return None
+
+
+def _remove_client(websocket: "ServerConnection"):
+    connected_clients.remove(websocket)
+    for message_id, origins in list(message_origins.items()):
+        origins.discard(websocket)
+        if not origins:
+            del message_origins[message_id]
+    for course, subscribers in list(course_subscribers.items()):
+        subscribers.discard(websocket)
+        if not subscribers:
+            del course_subscribers[course]
 
 
 async def handler(websocket: "ServerConnection"):
@@ -26,18 +145,30 @@ async def handler(websocket: "ServerConnection"):
             logger.info(f"📩 Received message: {message}")
             try:
                 data = json.loads(message)
+                if not isinstance(data, dict):
+                    logger.error("Non-object JSON message received")
+                    await websocket.send(
+                        json.dumps(
+                            {"status": "error", "message": "Expected a JSON object"}
+                        )
+                    )
+                    continue
+
                 action = data.get("action", "")
 
-                if action == "save_transcript":
-                    await add_to_queue(data)
-                    response = json.dumps(
-                        {
-                            "status": "success",
-                            "message": "Data received and queued",
-                            "messageId": data.get("messageId"),
-                        }
-                    )
-                    await websocket.send(response)
+                if action not in SUPPORTED_ACTIONS:
+                    continue
+
+                if error_response := _validate_identifiers(data):
+                    response = error_response
+                elif action == "save_transcript":
+                    response = await _handle_save_transcript(websocket, data)
+                elif action == "status":
+                    response = _handle_status(data)
+                else:
+                    response = _handle_subscription(websocket, data)
+
+                await websocket.send(json.dumps(response))
 
             except json.JSONDecodeError:
                 logger.error("Invalid JSON format received")
@@ -47,15 +178,16 @@ async def handler(websocket: "ServerConnection"):
     except ConnectionClosed:
         pass
     finally:
-        connected_clients.remove(websocket)
+        _remove_client(websocket)
         logger.info(
             f"❌ Client disconnected! Active connections: {len(connected_clients)}"
         )
 
 
-async def start_websocket_server(config: "ServerConfig"):
+async def start_websocket_server(
+    config: "ServerConfig", notion_client: Optional["NotionClient"] = None
+):
     from websockets import serve
-    from udemy_crawling.notion import connect_to_notion
 
     # Start the websocket server
     server = await serve(handler, "localhost", config.websocket_port)
@@ -63,11 +195,15 @@ async def start_websocket_server(config: "ServerConfig"):
         f"🚀 WebSocket server running at ws://localhost:{config.websocket_port}"
     )
 
-    # Await the async Notion connection before passing to worker
-    notion_client = await connect_to_notion(config.notion_token, config.database_id)
+    # Await the async Notion connection before passing to worker,
+    # unless a client (e.g. the load test stub) was provided by the caller
+    if notion_client is None:
+        from udemy_crawling.notion import connect_to_notion
+
+        notion_client = await connect_to_notion(config.notion_token, config.database_id)
 
     # Start queue worker with actual NotionClient
-    worker_task = asyncio.create_task(queue_worker(notion_client))
+    worker_task = asyncio.create_task(queue_worker(notion_client, notify_clients))
 
     # Wait for server shutdown and queue worker concurrently
     await asyncio.gather(server.wait_closed(), worker_task)